@@ -1,5 +1,6 @@
 import os
 import json
+import re
 from urllib.parse import unquote
 from enum import Enum
 import time
@@ -17,6 +18,7 @@ from fence.config import config
 from fence.errors import UserError, NotFound, Unauthorized, Forbidden
 from fence.resources.google.validity import GoogleProjectValidity
 from fence.resources.google.access_utils import (
+    GOOGLE_CLOUD_MANAGER_CACHE_SIZE,
     is_user_member_of_all_google_projects,
     is_user_member_of_google_project,
     get_registered_service_account_from_email,
@@ -29,6 +31,7 @@ from fence.resources.google.access_utils import (
     add_user_service_account_to_google,
     add_user_service_account_to_db,
     get_google_access_groups_for_service_account,
+    invalidate_google_project_cache,
 )
 from fence.resources.google.utils import (
     get_monitoring_service_account_email,
@@ -39,6 +42,10 @@ from fence.models import UserServiceAccount
 from fence.utils import get_valid_expiration_from_request
 from flask_sqlalchemy_session import current_session
 
+# Google project IDs, optionally prefixed with a domain for legacy
+# domain-scoped projects (e.g. "example.com:my-project")
+GOOGLE_PROJECT_ID_REGEX = re.compile(r"^(?:[a-z0-9.-]+:)?[a-z][a-z0-9-]{4,28}[a-z0-9]$")
+
 
 class ValidationErrors(str, Enum):
     MONITOR_NOT_FOUND = "monitor_not_found"
@@ -166,13 +173,37 @@ class GoogleServiceAccountRoot(Resource):
             )
 
         # if not monitor, we should assume google project ids and parse
-        google_project_ids = [
-            project_id.strip() for project_id in unquote(google_projects).split(",")
+        google_project_ids = list(
+            dict.fromkeys(
+                project_id.strip() for project_id in unquote(google_projects).split(",")
+            )
+        )
+
+        # every project ID gets its own cloud manager, so don't let a single
+        # request flush the manager cache or set up managers for junk IDs
+        if len(google_project_ids) > GOOGLE_CLOUD_MANAGER_CACHE_SIZE:
+            return (
+                "At most {} Google project IDs can be provided at once.".format(
+                    GOOGLE_CLOUD_MANAGER_CACHE_SIZE
+                ),
+                400,
+            )
+        invalid_project_ids = [
+            project_id
+            for project_id in google_project_ids
+            if not GOOGLE_PROJECT_ID_REGEX.match(project_id)
         ]
+        if invalid_project_ids:
+            return (
+                "Invalid Google project IDs: {}".format(", ".join(invalid_project_ids)),
+                400,
+            )
 
         # check if user has permission to get service accounts
-        # for these projects
+        # for these projects, against fresh Google project membership
         user_id = current_token["sub"]
+        for google_project_id in google_project_ids:
+            invalidate_google_project_cache(google_project_id)
         authorized = is_user_member_of_all_google_projects(user_id, google_project_ids)
 
         if not authorized:
@@ -203,6 +234,9 @@ class GoogleServiceAccountRoot(Resource):
         Returns:
             tuple(dict, int): (response_data, http_status_code)
         """
+        # always validate a registration against fresh Google data
+        invalidate_google_project_cache(sa.google_project_id)
+
         error_response = _get_service_account_error_status(sa)
 
         if error_response.get("success") is not True:
@@ -427,6 +461,8 @@ class GoogleServiceAccount(Resource):
         sa = _get_service_account_for_patch(id_)
         if type(sa) != GoogleServiceAccountRegistration:
             return sa
+        # always validate an update against fresh Google data
+        invalidate_google_project_cache(sa.google_project_id)
         error_response = _get_patched_service_account_error_status(id_, sa)
         if error_response.get("success") is not True:
             return error_response, 400
@@ -462,7 +498,9 @@ class GoogleServiceAccount(Resource):
 
         google_project_id = registered_service_account.google_project_id
 
-        # check if user has permission to delete the service account
+        # check if user has permission to delete the service account,
+        # against fresh Google project membership
+        invalidate_google_project_cache(google_project_id)
         with GoogleCloudManager(google_project_id) as gcm:
             authorized = is_user_member_of_google_project(user_id, gcm)
 
@@ -564,6 +602,8 @@ class GoogleServiceAccount(Resource):
         except Exception:
             return (" Can not delete the service account {}".format(id_), 500)
 
+        invalidate_google_project_cache(google_project_id)
+
         return "Successfully delete service account  {}".format(id_), 200
 
 
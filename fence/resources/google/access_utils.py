@@ -2,15 +2,25 @@
 Utilities for determine access and validity for service account
 registration.
 """
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
 import time
+import weakref
 import flask
 from urllib.parse import unquote
 
+from cachetools import LRUCache, TTLCache, cached
+from cachetools.keys import hashkey
+
 from cirrus.google_cloud.iam import GooglePolicyMember
 
 from cirrus.google_cloud.errors import GoogleAPIError
 from cirrus.google_cloud.iam import GooglePolicy
 from cirrus import GoogleCloudManager
+from googleapiclient.errors import HttpError as GoogleHttpError
+import httplib2
 
 import fence
 from cdislogging import get_logger
@@ -36,6 +46,271 @@ from fence.utils import get_valid_expiration_from_request
 
 logger = get_logger(__name__)
 
+# maximum number of opened GoogleCloudManagers kept around, one per project
+GOOGLE_CLOUD_MANAGER_CACHE_SIZE = 128
+
+
+# evicted managers are not closed since another thread may still be using
+# them, they are left for garbage collection instead
+_google_cloud_managers = LRUCache(maxsize=GOOGLE_CLOUD_MANAGER_CACHE_SIZE)
+# guards _google_cloud_managers, only held for cache lookups and updates
+_google_cloud_managers_lock = threading.Lock()
+# one lock per project so concurrent workers don't each set up a manager for
+# the same project while different projects are set up in parallel. Locks
+# go away once no thread holds on to them.
+_google_cloud_manager_setup_locks = weakref.WeakValueDictionary()
+
+
+def _get_manager(project_id=None):
+    """
+    Return a long-lived, already opened GoogleCloudManager for the given
+    project so that credential discovery and OAuth setup only happen once
+    per project per process. Managers still cached at interpreter exit are
+    closed then.
+
+    WARNING: The returned manager is shared, do NOT close it.
+
+    Args:
+        project_id (str, optional): Google project ID, if not provided the
+            default project is used
+
+    Returns:
+        GoogleCloudManager: opened cloud manager instance
+    """
+    with _google_cloud_managers_lock:
+        google_cloud_manager = _google_cloud_managers.get(project_id)
+        if google_cloud_manager is not None:
+            return google_cloud_manager
+        setup_lock = _google_cloud_manager_setup_locks.setdefault(
+            project_id, threading.Lock()
+        )
+
+    with setup_lock:
+        # another thread may have set it up while we waited
+        with _google_cloud_managers_lock:
+            google_cloud_manager = _google_cloud_managers.get(project_id)
+        if google_cloud_manager is None:
+            google_cloud_manager = GoogleCloudManager(project_id).__enter__()
+            with _google_cloud_managers_lock:
+                _google_cloud_managers[project_id] = google_cloud_manager
+    return google_cloud_manager
+
+
+@atexit.register
+def close_google_cloud_managers():
+    """
+    Close and drop all cached GoogleCloudManagers.
+    """
+    with _google_cloud_managers_lock:
+        while _google_cloud_managers:
+            _, google_cloud_manager = _google_cloud_managers.popitem()
+            google_cloud_manager.__exit__(None, None, None)
+
+
+# member types allowed on a Google project registering service accounts
+ALLOWED_PROJECT_MEMBER_TYPES = frozenset(
+    (GooglePolicyMember.SERVICE_ACCOUNT, GooglePolicyMember.USER)
+)
+
+# errors the Google API wrappers are expected to raise. cirrus already
+# retries transient (429/5xx) failures with backoff before raising these.
+GOOGLE_API_ERRORS = (GoogleAPIError, GoogleHttpError)
+
+# maximum number of Google API calls in flight at once across all threads
+GOOGLE_API_MAX_CONCURRENCY = 10
+_google_api_semaphore = threading.BoundedSemaphore(GOOGLE_API_MAX_CONCURRENCY)
+
+
+class _TokenBucket(object):
+    """
+    Thread-safe token bucket allowing `rate` calls per second on average,
+    with bursts of up to `rate` calls.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Refill the bucket."""
+        with self._lock:
+            self._tokens = self.capacity
+            self._updated_at = time.monotonic()
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens, sleeping until they are available.
+
+        Args:
+            tokens (int, optional): number of calls about to be made
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # reserve the tokens now and sleep outside the lock until they're ours
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# limits Google API calls started per second across all threads so callers
+# wait for their turn instead of running into Google's quota 429s. Built on
+# first use from config["GOOGLE_API_RATE_LIMIT"] (0 disables it).
+_google_api_rate_limiter = None
+_google_api_rate_limiter_lock = threading.Lock()
+
+
+def _get_google_api_rate_limiter():
+    """
+    Return the process-wide Google API rate limiter.
+
+    Returns:
+        _TokenBucket: rate limiter for calls to Google
+    """
+    global _google_api_rate_limiter
+    with _google_api_rate_limiter_lock:
+        if _google_api_rate_limiter is None:
+            _google_api_rate_limiter = _TokenBucket(config["GOOGLE_API_RATE_LIMIT"])
+        return _google_api_rate_limiter
+
+
+def _call_google(method, *args, **kwargs):
+    """
+    Call a GoogleCloudManager method, waiting for the process-wide rate limit
+    and concurrency limit before calling it.
+
+    Args:
+        method (Callable): bound GoogleCloudManager method
+        *args, **kwargs: passed to method
+
+    Returns:
+        whatever method returns
+    """
+    _get_google_api_rate_limiter().acquire()
+    with _google_api_semaphore:
+        return method(*args, **kwargs)
+
+
+# Read-only Google API responses that change on the order of hours are
+# cached for FENCE_GOOGLE_CACHE_TTL seconds (0 disables caching).
+GOOGLE_CACHE_TTL = int(os.environ.get("FENCE_GOOGLE_CACHE_TTL", 300))
+
+_parent_org_cache = TTLCache(maxsize=512, ttl=GOOGLE_CACHE_TTL)
+_project_membership_cache = TTLCache(maxsize=512, ttl=GOOGLE_CACHE_TTL)
+_sa_type_cache = TTLCache(maxsize=512, ttl=GOOGLE_CACHE_TTL)
+# a newly created user-managed key should be noticed quickly, so service
+# account keys are cached for at most a minute
+_sa_keys_cache = TTLCache(maxsize=512, ttl=min(GOOGLE_CACHE_TTL, 60))
+_google_cache_lock = threading.RLock()
+
+
+@cached(
+    _parent_org_cache,
+    key=lambda google_cloud_manager: hashkey(google_cloud_manager.project_id),
+    lock=_google_cache_lock,
+)
+def _has_parent_org(google_cloud_manager):
+    return _call_google(google_cloud_manager.get_project_organization)
+
+
+@cached(
+    _project_membership_cache,
+    key=lambda google_cloud_manager, project_id=None: hashkey(
+        project_id or google_cloud_manager.project_id
+    ),
+    lock=_google_cache_lock,
+)
+def _project_membership(google_cloud_manager, project_id=None):
+    if project_id:
+        return _call_google(google_cloud_manager.get_project_membership, project_id)
+    return _call_google(google_cloud_manager.get_project_membership)
+
+
+@cached(
+    _sa_type_cache,
+    key=lambda google_cloud_manager, account_id: hashkey(
+        google_cloud_manager.project_id, account_id
+    ),
+    lock=_google_cache_lock,
+)
+def _sa_type(google_cloud_manager, account_id):
+    try:
+        return _call_google(google_cloud_manager.get_service_account_type, account_id)
+    except GOOGLE_API_ERRORS as exc:
+        if not _is_permanent_google_error(exc):
+            raise
+        # the service account is missing or we can't see it, retrying
+        # won't change that so cache it as having no type
+        logger.warning(
+            "Could not get type of service account %s (google project: %s). "
+            "Details: %s",
+            account_id,
+            google_cloud_manager.project_id,
+            exc,
+        )
+        return None
+
+
+@cached(
+    _sa_keys_cache,
+    key=lambda google_cloud_manager, service_account: hashkey(
+        google_cloud_manager.project_id, service_account
+    ),
+    lock=_google_cache_lock,
+)
+def _sa_keys_info(google_cloud_manager, service_account):
+    return _call_google(
+        google_cloud_manager.get_service_account_keys_info, service_account
+    )
+
+
+def _is_permanent_google_error(exc):
+    """
+    Return whether the given Google API error won't go away on retry
+    (403 or 404). cirrus raises GoogleAPIError for forbidden requests.
+    """
+    if isinstance(exc, GoogleAPIError):
+        return True
+    status = getattr(getattr(exc, "resp", None), "status", None)
+    return int(status or 0) in (403, 404)
+
+
+def invalidate_google_project_cache(google_project_id):
+    """
+    Drop every cached Google API response for the given project, including
+    the type and keys of each of its service accounts, so the next validity
+    check sees fresh data.
+
+    Args:
+        google_project_id (str): Google project ID
+    """
+    with _google_cache_lock:
+        _parent_org_cache.pop(hashkey(google_project_id), None)
+        _project_membership_cache.pop(hashkey(google_project_id), None)
+        for cache in (_sa_type_cache, _sa_keys_cache):
+            for key in list(cache.keys()):
+                if key[0] == google_project_id:
+                    cache.pop(key, None)
+
+
+def clear_google_api_caches():
+    """
+    Drop all cached Google API responses.
+    """
+    with _google_cache_lock:
+        _parent_org_cache.clear()
+        _project_membership_cache.clear()
+        _sa_type_cache.clear()
+        _sa_keys_cache.clear()
+
 
 def bulk_update_google_groups(google_bulk_mapping):
     """
@@ -50,14 +325,14 @@ def bulk_update_google_groups(google_bulk_mapping):
     with GoogleCloudManager(google_project_id) as gcm:
         for group, expected_members in google_bulk_mapping.items():
             expected_members = set(expected_members)
-            logger.debug(f"Starting diff for group {group}...")
+            logger.debug("Starting diff for group %s...", group)
 
             # get members list from google
             google_members = set(
                 member.get("email") for member in gcm.get_group_members(group)
             )
-            logger.debug(f"Google membership for {group}: {google_members}")
-            logger.debug(f"Expected membership for {group}: {expected_members}")
+            logger.debug("Google membership for %s: %s", group, google_members)
+            logger.debug("Expected membership for %s: %s", group, expected_members)
 
             # diff between expected group membership and actual membership
             to_delete = set.difference(google_members, expected_members)
@@ -77,6 +352,134 @@ def bulk_update_google_groups(google_bulk_mapping):
                 gcm.remove_member_from_group(member_email, group)
 
 
+# maximum number of calls Fence puts in a single Google JSON batch request
+GOOGLE_BATCH_SIZE = 20
+
+
+class _BatchResponse(object):
+    """
+    Minimal stand-in for the requests.Response returned by GoogleCloudManager
+    so batched results can be used wherever a single response is expected.
+    """
+
+    def __init__(self, json_data, status_code):
+        self._json_data = json_data
+        self.status_code = status_code
+
+    def json(self):
+        return self._json_data
+
+
+def _execute_iam_batch(google_cloud_manager, service_accounts, build_request):
+    """
+    Execute one IAM API request per service account through Google's JSON
+    batch endpoint, at most GOOGLE_BATCH_SIZE requests per round trip.
+
+    Args:
+        google_cloud_manager (GoogleCloudManager): cloud manager instance
+        service_accounts (List(str)): service account emails or uniqueIds
+        build_request (Callable): called with the IAM serviceAccounts resource
+            and a service account's resource name, returns the request to add
+
+    Returns:
+        dict: service account -> _BatchResponse, a service account is missing
+            if the batch it was in could not be executed
+    """
+    responses = {}
+    service_accounts = list(service_accounts)
+    for start in range(0, len(service_accounts), GOOGLE_BATCH_SIZE):
+        chunk = service_accounts[start : start + GOOGLE_BATCH_SIZE]
+
+        def _callback(request_id, response, exception, chunk=chunk):
+            account = chunk[int(request_id)]
+            if exception is not None:
+                status_code = getattr(getattr(exception, "resp", None), "status", 500)
+                responses[account] = _BatchResponse({}, int(status_code))
+            else:
+                responses[account] = _BatchResponse(response, 200)
+
+        try:
+            service_accounts_api = (
+                google_cloud_manager._iam_service.projects().serviceAccounts()
+            )
+            batch = google_cloud_manager._iam_service.new_batch_http_request(
+                callback=_callback
+            )
+            for index, account in enumerate(chunk):
+                name = "projects/{}/serviceAccounts/{}".format(
+                    google_cloud_manager.project_id, account
+                )
+                batch.add(
+                    build_request(service_accounts_api, name), request_id=str(index)
+                )
+            # every request in the batch counts against the rate limit
+            _get_google_api_rate_limiter().acquire(len(chunk))
+            with _google_api_semaphore:
+                batch.execute()
+        except (GoogleHttpError, httplib2.HttpLib2Error, OSError) as exc:
+            logger.warning(
+                "Batch request for service accounts %s failed, they will be "
+                "requested individually. Details: %s",
+                chunk,
+                exc,
+            )
+
+    return responses
+
+
+def get_service_accounts(service_accounts, google_cloud_manager):
+    """
+    Get the given service accounts from Google using batched requests.
+
+    Args:
+        service_accounts (List(str)): service account emails or uniqueIds
+        google_cloud_manager (GoogleCloudManager): cloud manager instance
+
+    Returns:
+        dict: service account -> JSON response from Google, service accounts
+            that could not be retrieved are not included
+    """
+    responses = _execute_iam_batch(
+        google_cloud_manager,
+        service_accounts,
+        lambda service_accounts_api, name: service_accounts_api.get(name=name),
+    )
+    return {
+        account: response.json()
+        for account, response in responses.items()
+        if response.status_code == 200
+    }
+
+
+def get_service_account_policies(service_accounts, google_cloud_manager):
+    """
+    Get the IAM policies for the given service accounts using batched
+    requests. Each policy can be passed as the `policy` to
+    get_service_account_policy / service_account_has_external_access.
+
+    Args:
+        service_accounts (List(str)): service account emails or uniqueIds
+        google_cloud_manager (GoogleCloudManager): cloud manager instance
+
+    Returns:
+        dict: service account -> response with status_code and json(),
+            service accounts whose policy could not be retrieved are not
+            included so they get their own (retried) request later
+    """
+    responses = _execute_iam_batch(
+        google_cloud_manager,
+        service_accounts,
+        lambda service_accounts_api, name: service_accounts_api.getIamPolicy(
+            resource=name
+        ),
+    )
+    return {
+        account: response
+        for account, response in responses.items()
+        if response.status_code == 200
+    }
+
+
 def get_google_project_number(google_project_id, google_cloud_manager):
     """
     Return a project's "projectNumber" which uniquely identifies it.
@@ -91,7 +494,7 @@ def get_google_project_number(google_project_id, google_cloud_manager):
         str: string repsentation of an int64 uniquely identifying a Google project
     """
     try:
-        response = google_cloud_manager.get_project_info()
+        response = _call_google(google_cloud_manager.get_project_info)
         return response.get("projectNumber")
     except Exception as exc:
         logger.error(
@@ -114,7 +517,7 @@ def get_google_project_membership(project_id, google_cloud_manager):
         List(GooglePolicyMember): list of members on project's IAM
     """
 
-    return google_cloud_manager.get_project_membership(project_id)
+    return _project_membership(google_cloud_manager, project_id)
 
 
 def get_google_project_parent_org(google_cloud_manager):
@@ -129,8 +532,8 @@ def get_google_project_parent_org(google_cloud_manager):
         str: The Google projects parent organization name or None if it does't have one
     """
     try:
-        return google_cloud_manager.get_project_organization()
-    except Exception as exc:
+        return _has_parent_org(google_cloud_manager)
+    except GOOGLE_API_ERRORS as exc:
         logger.error(
             "Could not determine if Google project (id: {}) has parent org"
             "due to error (Details: {})".format(
@@ -162,27 +565,20 @@ def get_google_project_valid_users_and_service_accounts(
         NotSupported: Member is invalid type
     """
     try:
-        members = membership or google_cloud_manager.get_project_membership(project_id)
+        members = membership or _project_membership(google_cloud_manager, project_id)
+        users = []
+        service_accounts = []
         for member in members:
-            if not (
-                member.member_type == GooglePolicyMember.SERVICE_ACCOUNT
-                or member.member_type == GooglePolicyMember.USER
-            ):
+            if member.member_type not in ALLOWED_PROJECT_MEMBER_TYPES:
                 raise NotSupported(
                     "Member {} has invalid type: {}".format(
                         member.email_id, member.member_type
                     )
                 )
-        users = [
-            member
-            for member in members
-            if member.member_type == GooglePolicyMember.USER
-        ]
-        service_accounts = [
-            member
-            for member in members
-            if member.member_type == GooglePolicyMember.SERVICE_ACCOUNT
-        ]
+            if member.member_type == GooglePolicyMember.USER:
+                users.append(member)
+            else:
+                service_accounts.append(member)
         return users, service_accounts
     except Exception as exc:
         logger.error(
@@ -207,9 +603,9 @@ def is_valid_service_account_type(account_id, google_cloud_manager):
         in ALLOWED_USER_SERVICE_ACCOUNT_DOMAINS
     """
     try:
-        sa_type = google_cloud_manager.get_service_account_type(account_id)
+        sa_type = _sa_type(google_cloud_manager, account_id)
         return sa_type in config["ALLOWED_USER_SERVICE_ACCOUNT_DOMAINS"]
-    except Exception as exc:
+    except GOOGLE_API_ERRORS as exc:
         logger.error(
             "validity of Google service account {} (google project: {}) type "
             "determined False due to error. Details: {}".format(
@@ -232,8 +628,8 @@ def service_account_has_external_access(
     Returns:
         bool: whether or not the service account has external access
     """
-    response = policy or google_cloud_manager.get_service_account_policy(
-        service_account
+    response = policy or _call_google(
+        google_cloud_manager.get_service_account_policy, service_account
     )
     if response.status_code != 200:
         logger.error(
@@ -250,14 +646,12 @@ def service_account_has_external_access(
     if "bindings" in json_obj:
         policy = GooglePolicy.from_json(json_obj)
         if policy.roles:
-            logger.debug(
-                "Service account has role(s) assigned: {}".format(str(policy.roles))
-            )
+            logger.debug("Service account has role(s) assigned: %s", policy.roles)
             return True
 
-    key_info = google_cloud_manager.get_service_account_keys_info(service_account)
+    key_info = _sa_keys_info(google_cloud_manager, service_account)
     if key_info:
-        logger.debug("Service account has key(s): {}".format(str(key_info)))
+        logger.debug("Service account has key(s): %s", key_info)
         return True
     return False
 
@@ -346,18 +740,23 @@ def is_user_member_of_google_project(
         .first()
     )
 
+    # either the user's email or their linked account email must be in project
+    user_emails = {
+        email.lower()
+        for email in (
+            user.email,
+            linked_google_account.email if linked_google_account else None,
+        )
+        if email
+    }
+
     try:
-        members = membership or google_cloud_manager.get_project_membership()
-        member_emails = [member.email_id.lower() for member in members]
-        # first check if user.email is in project, then linked account
-        if not (user.email and user.email.lower() in member_emails):
-            if not (
-                linked_google_account
-                and linked_google_account.email.lower() in member_emails
-            ):
-                # no user email is in project
-                return False
-    except Exception as exc:
+        members = membership or _project_membership(google_cloud_manager)
+        # stop at the first matching member instead of collecting all emails
+        if not any(member.email_id.lower() in user_emails for member in members):
+            # no user email is in project
+            return False
+    except GOOGLE_API_ERRORS as exc:
         logger.error(
             "Could not determine if user (id: {}) is from project:"
             " {} due to error. Details: {}".format(
@@ -391,15 +790,54 @@ def is_user_member_of_all_google_projects(
               Google project IDs
     """
     is_member = False
-    for google_project_id in google_project_ids:
-        with GoogleCloudManager(google_project_id) as google_cloud_manager:
+    if membership:
+        for google_project_id in google_project_ids:
             is_member = is_user_member_of_google_project(
-                user_id, google_cloud_manager, db, membership
+                user_id, _get_manager(google_project_id), db, membership
             )
 
             if not is_member:
                 return False
 
+        return is_member
+
+    def _get_membership(google_project_id):
+        google_cloud_manager = _get_manager(google_project_id)
+        try:
+            return google_cloud_manager, _project_membership(google_cloud_manager)
+        except GOOGLE_API_ERRORS as exc:
+            logger.error(
+                "Could not get membership of Google project {}. "
+                "Details: {}".format(google_project_id, exc)
+            )
+            return google_cloud_manager, None
+
+    # fetch the memberships concurrently but check them against the db on this
+    # thread, the db session is not shared with the worker threads
+    google_project_ids = list(dict.fromkeys(google_project_ids))
+    if not google_project_ids:
+        return is_member
+
+    with ThreadPoolExecutor(
+        max_workers=min(GOOGLE_API_MAX_CONCURRENCY, len(google_project_ids))
+    ) as executor:
+        future_to_project = {
+            executor.submit(_get_membership, google_project_id): google_project_id
+            for google_project_id in google_project_ids
+        }
+        for future in as_completed(future_to_project):
+            google_cloud_manager, project_membership = future.result()
+            is_member = project_membership is not None and (
+                is_user_member_of_google_project(
+                    user_id, google_cloud_manager, db, project_membership
+                )
+            )
+
+            if not is_member:
+                for pending in future_to_project:
+                    pending.cancel()
+                return False
+
     return is_member
 
 
@@ -472,14 +910,25 @@ def do_all_users_have_access_to_project(users, project_id, db=None):
     session = get_db_session(db)
     # users will be list of fence.model.User's
     # check if all users has access to a project with project_id
-    for user in users:
-        access_privilege = (
-            session.query(AccessPrivilege)
-            .filter(AccessPrivilege.user_id == user.id)
-            .filter(AccessPrivilege.project_id == project_id)
-        ).first()
+    user_ids = {user.id for user in users}
+    if not user_ids:
+        return True
+
+    # one query for every user instead of one query per user
+    user_ids_with_access = {
+        user_id
+        for (user_id,) in (
+            session.query(AccessPrivilege.user_id)
+            .filter(
+                AccessPrivilege.user_id.in_(user_ids),
+                AccessPrivilege.project_id == project_id,
+            )
+            .distinct()
+        )
+    }
 
-        if not access_privilege:
+    for user in users:
+        if user.id not in user_ids_with_access:
             project = (session.query(Project).filter(Project.id == project_id)).first()
             project_rep = project.auth_id if project else project_id
             logger.info(
@@ -718,9 +1167,9 @@ def _revoke_user_service_account_from_google(
                     ):
 
                         logger.debug(
-                            "Removed {} from google group {}".format(
-                                service_account.email, access_group.email
-                            )
+                            "Removed %s from google group %s",
+                            service_account.email,
+                            access_group.email,
                         )
                     else:
                         raise GoogleAPIError("Can not remove {} from group {}")
@@ -746,15 +1195,13 @@ def add_user_service_account_to_google(
 
     """
     logger.debug(
-        "attempting to add {} to groups for projects: {}".format(
-            service_account, to_add_project_ids
-        )
+        "attempting to add %s to groups for projects: %s",
+        service_account,
+        to_add_project_ids,
     )
     for project_id in to_add_project_ids:
         access_groups = _get_google_access_groups(session, project_id)
-        logger.debug(
-            "google group(s) for project {}: {}".format(project_id, access_groups)
-        )
+        logger.debug("google group(s) for project %s: %s", project_id, access_groups)
         for access_group in access_groups:
             try:
                 # TODO: Need to remove try/catch after major refactor
@@ -766,9 +1213,9 @@ def add_user_service_account_to_google(
                     )
                     if response.get("email", None):
                         logger.debug(
-                            "Successfully add member {} to Google group {}.".format(
-                                service_account.email, access_group.email
-                            )
+                            "Successfully add member %s to Google group %s.",
+                            service_account.email,
+                            access_group.email,
                         )
                     else:
                         raise GoogleAPIError(
@@ -955,9 +1402,9 @@ def extend_service_account_access(service_account_email, db=None):
             expiration_time = min(expiration_time, requested_expiration)
 
         logger.debug(
-            "Service Account ({}) access extended to {}.".format(
-                service_account.email, expiration_time
-            )
+            "Service Account (%s) access extended to %s.",
+            service_account.email,
+            expiration_time,
         )
         for access_group in bucket_access_groups:
             bucket_access = (
@@ -1034,9 +1481,8 @@ def remove_white_listed_service_account_ids(sa_ids):
     white_listed_sa_emails = config.get("WHITE_LISTED_SERVICE_ACCOUNT_EMAILS", [])
 
     logger.debug(
-        "Removing whitelisted SAs {} from the SAs on the project.".format(
-            white_listed_sa_emails
-        )
+        "Removing whitelisted SAs %s from the SAs on the project.",
+        white_listed_sa_emails,
     )
 
     monitoring_service_account = get_monitoring_service_account_email()
@@ -1098,10 +1544,43 @@ def force_add_service_accounts_to_access(
     session = get_db_session(db)
 
     with GoogleCloudManager(google_project_id) as google_project:
-        for service_account_email in service_account_emails:
-            g_service_account = google_project.get_service_account(
-                service_account_email
+        # one paginated list call instead of a get per service account,
+        # the list response already includes uniqueId for each account
+        try:
+            listed_service_accounts = _call_google(
+                google_project.get_all_service_accounts
+            )
+        except KeyError:
+            # Google leaves "accounts" out of the response when the project
+            # has no user-managed service accounts
+            logger.info(
+                "No service accounts listed on Google project %s, getting "
+                "them individually.",
+                google_project_id,
             )
+            listed_service_accounts = []
+        project_service_accounts = {
+            g_service_account.get("email", "").lower(): g_service_account
+            for g_service_account in listed_service_accounts
+        }
+        # SAs from other projects (e.g. Google-managed) aren't listed
+        unlisted_service_accounts = [
+            service_account_email
+            for service_account_email in service_account_emails
+            if service_account_email.lower() not in project_service_accounts
+        ]
+        if unlisted_service_accounts:
+            project_service_accounts.update(
+                (account.lower(), g_service_account)
+                for account, g_service_account in get_service_accounts(
+                    unlisted_service_accounts, google_project
+                ).items()
+            )
+
+        for service_account_email in service_account_emails:
+            g_service_account = project_service_accounts.get(
+                service_account_email.lower()
+            ) or _call_google(google_project.get_service_account, service_account_email)
             sa = (
                 session.query(UserServiceAccount)
                 .filter_by(email=service_account_email)
@@ -1129,7 +1608,7 @@ def force_add_service_accounts_to_access(
             )
 
 
-def get_service_account_policy(account, google_cloud_manager):
+def get_service_account_policy(account, google_cloud_manager, policy=None):
     """
     Get the policy for the service account identified by `account`,
     using the provided cloud_manager
@@ -1137,11 +1616,16 @@ def get_service_account_policy(account, google_cloud_manager):
     Args:
         account(str): service account identifier
         google_cloud_manager: cloud_manager instance
+        policy (Response, optional): pre-fetched policy response (e.g. from
+            get_service_account_policies), Will make call to Google API if
+            policy is None
     Returns:
         (Response): returns response from Google API
 
     """
-    sa_policy = google_cloud_manager.get_service_account_policy(account)
+    sa_policy = policy or _call_google(
+        google_cloud_manager.get_service_account_policy, account
+    )
     if sa_policy.status_code != 200:
         raise NotFound(
             "Unable to get Service Account policy (status: {})".format(
@@ -22,6 +22,7 @@ from fence.resources.google.access_utils import (
     get_project_from_auth_id,
     get_google_project_number,
     get_service_account_policy,
+    get_service_account_policies,
     remove_white_listed_service_account_ids,
     is_org_whitelisted,
     is_user_member_of_google_project,
@@ -448,9 +449,27 @@ class GoogleProjectValidity(ValidityInfo):
         # validity. then check all the service accounts. Top level will be
         # invalid if any service accounts are invalid
         service_accounts_validity = ValidityInfo()
+
+        # fetch policies for the project's own user-managed SAs in batches
+        # instead of one request per SA
+        service_account_policies = get_service_account_policies(
+            [
+                service_account
+                for service_account in service_accounts
+                if not is_google_managed_service_account(str(service_account))
+                and is_service_account_from_google_project(
+                    service_account, self.google_project_id, google_project_number
+                )
+            ],
+            self.google_cloud_manager,
+        )
+
         for service_account in service_accounts:
             service_account_validity_info = self._get_project_sa_validity_info(
-                service_account, google_project_number, early_return
+                service_account,
+                google_project_number,
+                early_return,
+                service_account_policy=service_account_policies.get(service_account),
             )
 
             # update project with error info from the service accounts
@@ -572,7 +591,11 @@ class GoogleProjectValidity(ValidityInfo):
         return
 
     def _get_project_sa_validity_info(
-        self, service_account, google_project_number, early_return
+        self,
+        service_account,
+        google_project_number,
+        early_return,
+        service_account_policy=None,
     ):
         service_account_id = str(service_account)
 
@@ -581,6 +604,7 @@ class GoogleProjectValidity(ValidityInfo):
             self.google_project_id,
             google_project_number=google_project_number,
             google_cloud_manager=self.google_cloud_manager,
+            service_account_policy=service_account_policy,
         )
 
         logger.debug(
@@ -663,11 +687,25 @@ class GoogleServiceAccountValidity(ValidityInfo):
         google_project_id,
         google_cloud_manager=None,
         google_project_number=None,
+        service_account_policy=None,
         *args,
         **kwargs
     ):
+        """
+        Initialize
+
+        Args:
+            account_id (str): service account identifier
+            google_project_id (str): Google project identifier
+            google_cloud_manager (GoogleCloudManager, optional): cloud manager
+                instance for the Google project
+            google_project_number (str, optional): Google project number
+            service_account_policy (Response, optional): pre-fetched policy for
+                the service account from the Google project, fetched if None
+        """
         self.account_id = account_id
         self.google_project_id = google_project_id
+        self.service_account_policy = service_account_policy
 
         # default to the given project id if not provided
         self.google_project_number = google_project_number or google_project_id
@@ -746,7 +784,16 @@ class GoogleServiceAccountValidity(ValidityInfo):
         if check_policy_accessible:
             try:
                 policy_accessible = True
-                sa_policy = get_service_account_policy(self.account_id, gcm)
+                # a pre-fetched policy came from this SA's google project
+                sa_policy = get_service_account_policy(
+                    self.account_id,
+                    gcm,
+                    policy=(
+                        self.service_account_policy
+                        if is_owned_by_google_project
+                        else None
+                    ),
+                )
             except Exception:
                 policy_accessible = False
                 gcm.close()
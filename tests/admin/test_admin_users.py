@@ -1,7 +1,8 @@
 import pytest
+from sqlalchemy.orm import joinedload
 
 import fence.resources.admin as adm
-from fence.models import User, AccessPrivilege, Project, UserToGroup, Group
+from fence.models import User, AccessPrivilege, UserToGroup
 from fence.errors import NotFound, UserError
 
 
@@ -115,56 +116,43 @@ def test_add_user_to_group(db_session, awg_users, awg_groups):
     adm.add_user_to_groups(db_session, "awg_user_2", ["test_group_4"])
     accesses = (
         db_session.query(AccessPrivilege)
+        .options(joinedload(AccessPrivilege.project))
         .join(AccessPrivilege.user)
         .filter(User.username == "awg_user_2")
         .all()
     )
-    projects = [
-        db_session.query(Project).filter(Project.id == item.project_id).first().name
-        for item in accesses
-        if item.project_id != None
-    ]
+    projects = [item.project.name for item in accesses if item.project_id != None]
     assert "test_project_6" in projects
     assert "test_project_7" in projects
     group_access = (
         db_session.query(UserToGroup)
+        .options(joinedload(UserToGroup.group))
         .join(UserToGroup.user)
         .filter(User.username == "awg_user_2")
         .first()
     )
-    assert (
-        "test_group_4"
-        == db_session.query(Group)
-        .filter(Group.id == group_access.group_id)
-        .first()
-        .name
-    )
+    assert "test_group_4" == group_access.group.name
 
 
 def test_remove_user_from_group(db_session, awg_users, awg_groups):
     accesses = (
         db_session.query(AccessPrivilege)
+        .options(joinedload(AccessPrivilege.project))
         .join(AccessPrivilege.user)
         .filter(User.username == "awg_user")
         .all()
     )
-    projects = [
-        db_session.query(Project).filter(Project.id == item.project_id).first().name
-        for item in accesses
-        if item.project_id != None
-    ]
+    projects = [item.project.name for item in accesses if item.project_id != None]
     assert "test_project_1" in projects
     assert "test_project_2" in projects
     group_access = (
         db_session.query(UserToGroup)
+        .options(joinedload(UserToGroup.group))
         .join(UserToGroup.user)
         .filter(User.username == "awg_user")
         .all()
     )
-    groups = [
-        db_session.query(Group).filter(Group.id == group.group_id).first().name
-        for group in group_access
-    ]
+    groups = [group.group.name for group in group_access]
     assert "test_group_1" in groups
     assert "test_group_2" in groups
 
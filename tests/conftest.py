@@ -29,10 +29,15 @@ from mock import patch, MagicMock
 from moto import mock_sts
 import pytest
 import requests
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.schema import DropTable
+import yaml
 
 import fence
+import fence.resources.aws.boto_manager
+import fence.resources.storage
 from fence import app_init
 from fence import models
 from fence.jwt.keys import Keypair
@@ -78,27 +83,40 @@ def claims_refresh():
 
 
 @pytest.fixture(scope="session")
-def encoded_jwt(kid, rsa_private_key):
+def rsa_private_key_obj(_hazmat_rsa_private_key):
+    """
+    Return the loaded private key object that rsa_private_key is serialized
+    from. PyJWT accepts it directly, so signing with it skips parsing the PEM
+    on every jwt.encode call.
+    """
+    return _hazmat_rsa_private_key
+
+
+@pytest.fixture(scope="session")
+def encoded_jwt(kid, rsa_private_key_obj):
     """
     Return an example JWT containing the claims and encoded with the private
     key.
     Args:
-        rsa_private_key (str): fixture
+        rsa_private_key_obj (RSAPrivateKey): fixture
     Return:
         str: JWT containing claims encoded with private key
     """
     headers = {"kid": kid}
     return jwt.encode(
-        utils.default_claims(), key=rsa_private_key, headers=headers, algorithm="RS256"
+        utils.default_claims(),
+        key=rsa_private_key_obj,
+        headers=headers,
+        algorithm="RS256",
     ).decode("utf-8")
 
 
 @pytest.fixture(scope="session")
-def encoded_jwt_expired(kid, rsa_private_key):
+def encoded_jwt_expired(kid, rsa_private_key_obj):
     """
     Return an example JWT that has already expired.
     Args:
-        rsa_private_key (str): fixture
+        rsa_private_key_obj (RSAPrivateKey): fixture
     Return:
         str: JWT containing claims encoded with private key
     """
@@ -108,60 +126,27 @@ def encoded_jwt_expired(kid, rsa_private_key):
     claims_expired["exp"] -= 10000
     claims_expired["iat"] -= 10000
     return jwt.encode(
-        claims_expired, key=rsa_private_key, headers=headers, algorithm="RS256"
+        claims_expired, key=rsa_private_key_obj, headers=headers, algorithm="RS256"
     ).decode("utf-8")
 
 
 @pytest.fixture(scope="session")
-def encoded_jwt_refresh_token(claims_refresh, kid, rsa_private_key):
+def encoded_jwt_refresh_token(claims_refresh, kid, rsa_private_key_obj):
     """
     Return an example JWT refresh token containing the claims and encoded with
     the private key.
     Args:
         claims_refresh (dict): fixture
-        rsa_private_key (str): fixture
+        rsa_private_key_obj (RSAPrivateKey): fixture
     Return:
         str: JWT refresh token containing claims encoded with private key
     """
     headers = {"kid": kid}
     return jwt.encode(
-        claims_refresh, key=rsa_private_key, headers=headers, algorithm="RS256"
+        claims_refresh, key=rsa_private_key_obj, headers=headers, algorithm="RS256"
     ).decode("utf-8")
 
 
-class Mocker(object):
-    def mock_functions(self):
-        self.patcher = patch("fence.resources.storage.get_client", get_client)
-        self.auth_patcher = patch(
-            "fence.resources.storage.StorageManager.check_auth",
-            lambda cls, backend, user: True,
-        )
-        self.boto_patcher = patch(
-            "fence.resources.aws.boto_manager.BotoManager.get_bucket_region",
-            mock_get_bucket_location,
-        )
-        self.assume_role_patcher = patch(
-            "fence.resources.aws.boto_manager.BotoManager.assume_role", mock_assume_role
-        )
-        self.patcher.start()
-        self.auth_patcher.start()
-        self.boto_patcher.start()
-        self.assume_role_patcher.start()
-        self.additional_patchers = []
-
-    def unmock_functions(self):
-        self.patcher.stop()
-        self.auth_patcher.stop()
-        self.boto_patcher.stop()
-        self.assume_role_patcher.stop()
-        for patcher in self.additional_patchers:
-            patcher.stop()
-
-    def add_mock(self, patcher):
-        patcher.start()
-        self.additional_patchers.append(patcher)
-
-
 @pytest.fixture(scope="session")
 def kid():
     """Return a JWT key ID to use for tests."""
@@ -224,14 +209,64 @@ def mock_arborist_requests(request):
     return do_patch
 
 
+def pytest_configure():
+    """
+    Stub out storage and boto once for the whole test run, so per-test
+    fixtures only need to patch what is specific to them.
+    """
+    fence.resources.storage.get_client = get_client
+    fence.resources.storage.StorageManager.check_auth = lambda cls, backend, user: True
+    fence.resources.aws.boto_manager.BotoManager.get_bucket_region = (
+        mock_get_bucket_location
+    )
+    fence.resources.aws.boto_manager.BotoManager.assume_role = mock_assume_role
+
+
+def _xdist_worker_config_path(config_path, tmpdir_factory):
+    """
+    When running under pytest-xdist, give each worker process its own test
+    database (e.g. fence_test_tmp_gw0), since every worker creates and drops
+    all the tables. Return the path of a copy of the test config pointing at
+    the worker's database, creating the database if it doesn't exist yet.
+    Outside of xdist the config path is returned unchanged.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return config_path
+
+    with open(config_path) as f:
+        worker_config = yaml.safe_load(f)
+
+    db_url = make_url(worker_config["DB"])
+    worker_db = "{}_{}".format(db_url.database, worker)
+    engine = create_engine(db_url, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), name=worker_db
+        ).scalar()
+        if not exists:
+            connection.execute('CREATE DATABASE "{}"'.format(worker_db))
+    engine.dispose()
+
+    db_url.database = worker_db
+    worker_config["DB"] = str(db_url)
+    worker_config_path = str(
+        tmpdir_factory.mktemp(worker).join(os.path.basename(config_path))
+    )
+    with open(worker_config_path, "w") as f:
+        yaml.safe_dump(worker_config, f)
+    return worker_config_path
+
+
 @pytest.fixture(scope="session")
-def app(kid, rsa_private_key, rsa_public_key):
+def app(kid, rsa_private_key, rsa_public_key, tmpdir_factory):
     """
     Flask application fixture.
     """
-    mocker = Mocker()
-    mocker.mock_functions()
     root_dir = os.path.dirname(os.path.realpath(__file__))
+    config_path = _xdist_worker_config_path(
+        os.path.join(root_dir, "test-fence-config.yaml"), tmpdir_factory
+    )
 
     # delete the record operation from the data blueprint, because right now it calls a
     # whole bunch of stuff on the arborist client to do some setup for the uploader role
@@ -244,7 +279,7 @@ def app(kid, rsa_private_key, rsa_public_key):
         fence.app,
         test_settings,
         root_dir=root_dir,
-        config_path=os.path.join(root_dir, "test-fence-config.yaml"),
+        config_path=config_path,
     )
 
     # We want to set up the keys so that the test application can load keys
@@ -411,8 +446,6 @@ def unauthorized_oauth_user(app, db_session):
 
 @pytest.fixture(scope="function")
 def indexd_client(app, request):
-    mocker = Mocker()
-    mocker.mock_functions()
     record = {}
 
     protocol = "s3"
@@ -499,14 +532,12 @@ def indexd_client(app, request):
         blank_patcher = patch(
             "fence.blueprints.data.indexd.BlankIndex.index_document", mock
         )
-        mocker.add_mock(indexd_patcher)
-        mocker.add_mock(blank_patcher)
-
-        output = {"mocker": mocker, "indexed_file_location": None}
+        indexd_patcher.start()
+        request.addfinalizer(indexd_patcher.stop)
+        blank_patcher.start()
+        request.addfinalizer(blank_patcher.stop)
 
-        yield output
-
-        mocker.unmock_functions()
+        yield {"indexed_file_location": None}
 
         return
     else:
@@ -531,19 +562,16 @@ def indexd_client(app, request):
     blank_patcher = patch(
         "fence.blueprints.data.indexd.BlankIndex.index_document", record
     )
-    mocker.add_mock(indexd_patcher)
-    mocker.add_mock(blank_patcher)
+    indexd_patcher.start()
+    request.addfinalizer(indexd_patcher.stop)
+    blank_patcher.start()
+    request.addfinalizer(blank_patcher.stop)
 
-    output = {
-        "mocker": mocker,
+    yield {
         # only gs or s3 for location, ignore specifiers after the _
         "indexed_file_location": protocol.split("_")[0],
     }
 
-    yield output
-
-    mocker.unmock_functions()
-
 
 @pytest.fixture(scope="function")
 def indexd_client_with_arborist(app, request):
@@ -661,17 +689,14 @@ def indexd_client_with_arborist(app, request):
                 "updated_date": "",
             }
 
-        mocker = Mocker()
-        mocker.mock_functions()
-
         # TODO (rudyardrichter, 2018-11-03): consolidate things needing to do this patch
         indexd_patcher = patch(
             "fence.blueprints.data.indexd.IndexedFile.index_document", record
         )
-        mocker.add_mock(indexd_patcher)
+        indexd_patcher.start()
+        request.addfinalizer(indexd_patcher.stop)
 
         output = {
-            "mocker": mocker,
             # only gs or s3 for location, ignore specifiers after the _
             "indexed_file_location": protocol.split("_")[0],
         }
@@ -683,8 +708,6 @@ def indexd_client_with_arborist(app, request):
 
 @pytest.fixture(scope="function")
 def unauthorized_indexd_client(app, request):
-    mocker = Mocker()
-    mocker.mock_functions()
     record = {}
 
     protocol = "s3"
@@ -751,13 +774,12 @@ def unauthorized_indexd_client(app, request):
     indexd_patcher = patch(
         "fence.blueprints.data.indexd.IndexedFile.index_document", record
     )
-    mocker.add_mock(indexd_patcher)
+    indexd_patcher.start()
+    request.addfinalizer(indexd_patcher.stop)
 
 
 @pytest.fixture(scope="function")
 def public_indexd_client(app, request):
-    mocker = Mocker()
-    mocker.mock_functions()
 
     protocol = "s3"
     if hasattr(request, "param"):
@@ -823,7 +845,8 @@ def public_indexd_client(app, request):
     indexd_patcher = patch(
         "fence.blueprints.data.indexd.IndexedFile.index_document", record
     )
-    mocker.add_mock(indexd_patcher)
+    indexd_patcher.start()
+    request.addfinalizer(indexd_patcher.stop)
 
 
 @pytest.fixture(scope="session")
@@ -833,8 +856,6 @@ def uploader_username():
 
 @pytest.fixture(scope="function")
 def public_bucket_indexd_client(app, request):
-    mocker = Mocker()
-    mocker.mock_functions()
 
     protocol = "s3"
     if hasattr(request, "param"):
@@ -914,7 +935,7 @@ def public_bucket_indexd_client(app, request):
     indexd_patcher = patch(
         "fence.blueprints.data.indexd.IndexedFile.index_document", record
     )
-    mocker.add_mock(indexd_patcher)
+    indexd_patcher.start()
     request.addfinalizer(indexd_patcher.stop)
 
     return protocol
@@ -1088,6 +1109,10 @@ def google_proxy_group(app, db_session, user_client):
 
 @pytest.fixture(scope="function")
 def cloud_manager():
+    # managers cached by access_utils would otherwise outlive the patch
+    fence.resources.google.access_utils.close_google_cloud_managers()
+    fence.resources.google.access_utils.clear_google_api_caches()
+    fence.resources.google.access_utils._google_api_rate_limiter = None
     manager = MagicMock()
     patch("fence.blueprints.storage_creds.google.GoogleCloudManager", manager).start()
     patch("fence.resources.google.utils.GoogleCloudManager", manager).start()
@@ -1132,14 +1157,14 @@ def google_signed_url():
 
 @pytest.fixture(scope="function")
 def encoded_creds_jwt(
-    kid, rsa_private_key, user_client, oauth_client, google_proxy_group
+    kid, rsa_private_key_obj, user_client, oauth_client, google_proxy_group
 ):
     """
     Return a JWT and user_id for a new user containing the claims and
     encoded with the private key.
     Args:
         claims (dict): fixture
-        rsa_private_key (str): fixture
+        rsa_private_key_obj (RSAPrivateKey): fixture
     Return:
         str: JWT containing claims encoded with private key
     """
@@ -1152,7 +1177,7 @@ def encoded_creds_jwt(
                 oauth_client["client_id"],
                 google_proxy_group["id"],
             ),
-            key=rsa_private_key,
+            key=rsa_private_key_obj,
             headers=headers,
             algorithm="RS256",
         ).decode("utf-8"),
@@ -1164,13 +1189,13 @@ def encoded_creds_jwt(
 
 
 @pytest.fixture(scope="function")
-def encoded_jwt_no_proxy_group(kid, rsa_private_key, user_client, oauth_client):
+def encoded_jwt_no_proxy_group(kid, rsa_private_key_obj, user_client, oauth_client):
     """
     Return a JWT and user_id for a new user containing the claims and
     encoded with the private key.
     Args:
         claims (dict): fixture
-        rsa_private_key (str): fixture
+        rsa_private_key_obj (RSAPrivateKey): fixture
     Return:
         str: JWT containing claims encoded with private key
     """
@@ -1182,7 +1207,7 @@ def encoded_jwt_no_proxy_group(kid, rsa_private_key, user_client, oauth_client):
                 user_client["user_id"],
                 oauth_client["client_id"],
             ),
-            key=rsa_private_key,
+            key=rsa_private_key_obj,
             headers=headers,
             algorithm="RS256",
         ).decode("utf-8"),
@@ -15,6 +15,7 @@ from userdatamodel.driver import SQLAlchemyDriver
 from fence.sync.sync_users import UserSyncer
 from fence.resources import userdatamodel as udm
 
+from fence.config import config
 from fence.models import AccessPrivilege, AuthorizationProvider, User, GA4GHVisaV1
 
 from gen3authz.client.arborist.client import ArboristClient
@@ -140,14 +141,8 @@ def syncer(db_session, request, rsa_private_key, kid):
             )
         )
     ).get("dbGaP")
-    test_db = yaml_load(
-        open(
-            os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                "test-fence-config.yaml",
-            )
-        )
-    ).get("DB")
+    # the app fixture may point the DB at a per-worker database under xdist
+    test_db = config["DB"]
 
     syncer_obj = UserSyncer(
         dbGaP=dbGap,
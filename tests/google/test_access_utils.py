@@ -2,16 +2,20 @@ import pytest
 import time
 
 from unittest.mock import MagicMock, patch
+from cachetools import LRUCache
 from sqlalchemy import or_
 
 from cirrus.errors import CirrusError
 from cirrus.google_cloud import GoogleCloudManager
+from cirrus.google_cloud.errors import GoogleAPIError
 from cirrus.google_cloud.iam import GooglePolicyMember
 
 import fence
 from fence.errors import NotFound
 from fence.models import (
+    AccessPrivilege,
     Project,
+    User,
     UserServiceAccount,
     ServiceAccountAccessPrivilege,
     ServiceAccountToGoogleBucketAccessGroup,
@@ -26,6 +30,15 @@ from fence.resources.google.access_utils import (
     extend_service_account_access,
     patch_user_service_account,
     remove_white_listed_service_account_ids,
+    is_user_member_of_all_google_projects,
+    _get_manager,
+    get_google_project_membership,
+    invalidate_google_project_cache,
+    force_add_service_accounts_to_access,
+    get_service_account_policies,
+    do_all_users_have_access_to_project,
+    is_user_member_of_google_project,
+    _TokenBucket,
 )
 
 
@@ -542,3 +555,386 @@ def test_whitelisted_service_accounts(
     assert "test@123" not in service_account_ids
     assert "test@456" not in service_account_ids
     assert "test@789" in service_account_ids
+
+
+def test_get_manager_reuses_manager_per_project(cloud_manager):
+    """
+    Test that a cloud manager is only set up once per Google project
+    """
+    first = _get_manager("project-a")
+    assert _get_manager("project-a") is first
+    _get_manager("project-b")
+
+    assert cloud_manager.call_count == 2
+    assert cloud_manager.return_value.__enter__.call_count == 2
+
+
+def test_evicted_google_cloud_manager_is_not_closed(cloud_manager):
+    """
+    Test that a cloud manager evicted from the manager cache is not closed,
+    since another thread may still be using it
+    """
+    with patch(
+        "fence.resources.google.access_utils._google_cloud_managers",
+        LRUCache(maxsize=1),
+    ):
+        _get_manager("project-a")
+        _get_manager("project-b")
+
+    assert cloud_manager.call_count == 2
+    assert not cloud_manager.return_value.__exit__.called
+
+
+def test_is_user_member_of_all_google_projects_reuses_manager(
+    cloud_manager, db_session
+):
+    """
+    Test that repeated membership checks against the same Google project
+    do not set up a new cloud manager
+    """
+    member_mock = MagicMock(return_value=True)
+    with patch(
+        "fence.resources.google.access_utils.is_user_member_of_google_project",
+        member_mock,
+    ):
+        assert is_user_member_of_all_google_projects(1, ["project-a"])
+        assert is_user_member_of_all_google_projects(1, ["project-a"])
+
+    assert cloud_manager.call_count == 1
+    assert member_mock.call_count == 2
+
+
+def test_google_project_membership_is_cached(cloud_manager):
+    """
+    Test that project membership is only fetched from Google once until the
+    project's cache entry is invalidated
+    """
+    cloud_manager.project_id = "project-a"
+    (cloud_manager.get_project_membership.return_value) = [
+        GooglePolicyMember("user", "user@gmail.com")
+    ]
+
+    get_google_project_membership("project-a", cloud_manager)
+    get_google_project_membership("project-a", cloud_manager)
+    assert cloud_manager.get_project_membership.call_count == 1
+
+    invalidate_google_project_cache("project-a")
+    get_google_project_membership("project-a", cloud_manager)
+    assert cloud_manager.get_project_membership.call_count == 2
+
+
+def test_service_account_type_is_cached(cloud_manager):
+    """
+    Test that a service account's type is only fetched from Google once
+    """
+    (cloud_manager.get_service_account_type.return_value) = "iam.gserviceaccount.com"
+
+    assert is_valid_service_account_type("sa@test", cloud_manager)
+    assert is_valid_service_account_type("sa@test", cloud_manager)
+    assert cloud_manager.get_service_account_type.call_count == 1
+
+
+def test_service_account_type_not_found_is_cached(cloud_manager):
+    """
+    Test that a service account Google reports as not found is cached as
+    invalid instead of being looked up again
+    """
+    from googleapiclient.errors import HttpError
+
+    (cloud_manager.get_service_account_type.side_effect) = HttpError(
+        MagicMock(status=404), bytes("Not found", "utf-8")
+    )
+
+    assert not is_valid_service_account_type("sa@test", cloud_manager)
+    assert not is_valid_service_account_type("sa@test", cloud_manager)
+    assert cloud_manager.get_service_account_type.call_count == 1
+
+
+def test_service_account_type_server_error_is_not_cached(cloud_manager):
+    """
+    Test that a transient Google error is not cached so the next check
+    tries again
+    """
+    from googleapiclient.errors import HttpError
+
+    (cloud_manager.get_service_account_type.side_effect) = [
+        HttpError(MagicMock(status=503), bytes("Unavailable", "utf-8")),
+        "iam.gserviceaccount.com",
+    ]
+
+    assert not is_valid_service_account_type("sa@test", cloud_manager)
+    assert is_valid_service_account_type("sa@test", cloud_manager)
+    assert cloud_manager.get_service_account_type.call_count == 2
+
+
+def test_service_account_keys_info_is_cached(cloud_manager):
+    """
+    Test that a service account's keys are only fetched from Google once
+    when checking external access repeatedly
+    """
+    (cloud_manager.get_service_account_policy.return_value) = MockResponse(
+        {"etag": "ACAB"}, 200
+    )
+    (cloud_manager.get_service_account_keys_info.return_value) = []
+
+    assert not service_account_has_external_access("sa@test", cloud_manager)
+    assert not service_account_has_external_access("sa@test", cloud_manager)
+    assert cloud_manager.get_service_account_keys_info.call_count == 1
+
+    invalidate_google_project_cache(cloud_manager.project_id)
+    assert not service_account_has_external_access("sa@test", cloud_manager)
+    assert cloud_manager.get_service_account_keys_info.call_count == 2
+
+
+def test_invalidate_google_project_cache_drops_all_service_accounts(cloud_manager):
+    """
+    Test that invalidating a project drops the cached type and keys of every
+    service account in it, not just the one being registered
+    """
+    (cloud_manager.get_service_account_type.return_value) = "iam.gserviceaccount.com"
+    (cloud_manager.get_service_account_policy.return_value) = MockResponse(
+        {"etag": "ACAB"}, 200
+    )
+    (cloud_manager.get_service_account_keys_info.return_value) = []
+
+    for service_account in ("sa-1@test", "sa-2@test"):
+        assert is_valid_service_account_type(service_account, cloud_manager)
+        assert not service_account_has_external_access(service_account, cloud_manager)
+    assert cloud_manager.get_service_account_type.call_count == 2
+    assert cloud_manager.get_service_account_keys_info.call_count == 2
+
+    invalidate_google_project_cache(cloud_manager.project_id)
+
+    for service_account in ("sa-1@test", "sa-2@test"):
+        assert is_valid_service_account_type(service_account, cloud_manager)
+        assert not service_account_has_external_access(service_account, cloud_manager)
+    assert cloud_manager.get_service_account_type.call_count == 4
+    assert cloud_manager.get_service_account_keys_info.call_count == 4
+
+
+def test_force_add_service_accounts_lists_project_service_accounts_once(
+    cloud_manager, db_session
+):
+    """
+    Test that service accounts on the Google project are retrieved with a
+    single list call instead of one call per service account
+    """
+    google_project = cloud_manager.return_value.__enter__.return_value
+    google_project.get_all_service_accounts.return_value = [
+        {"email": "sa-1@test.iam.gserviceaccount.com", "uniqueId": "1"},
+        {"email": "sa-2@test.iam.gserviceaccount.com", "uniqueId": "2"},
+    ]
+
+    force_add_service_accounts_to_access(
+        service_account_emails=[
+            "sa-1@test.iam.gserviceaccount.com",
+            "sa-2@test.iam.gserviceaccount.com",
+        ],
+        google_project_id="test",
+        project_access=[],
+    )
+
+    assert google_project.get_all_service_accounts.call_count == 1
+    assert not google_project.get_service_account.called
+    assert (
+        db_session.query(UserServiceAccount)
+        .filter_by(email="sa-2@test.iam.gserviceaccount.com")
+        .first()
+        .google_unique_id
+    ) == "2"
+
+
+def test_force_add_service_accounts_project_without_listed_service_accounts(
+    cloud_manager, db_session
+):
+    """
+    Test that service accounts are still added when Google lists no service
+    accounts on the project (the list response has no "accounts" key)
+    """
+    google_project = cloud_manager.return_value.__enter__.return_value
+    google_project.get_all_service_accounts.side_effect = KeyError("accounts")
+    google_project.get_service_account.return_value = {"uniqueId": "1"}
+
+    force_add_service_accounts_to_access(
+        service_account_emails=["service-1@compute-system.iam.gserviceaccount.com"],
+        google_project_id="test",
+        project_access=[],
+    )
+
+    assert (
+        db_session.query(UserServiceAccount)
+        .filter_by(email="service-1@compute-system.iam.gserviceaccount.com")
+        .first()
+        .google_unique_id
+    ) == "1"
+
+
+def test_get_service_account_policies_batches_requests(cloud_manager):
+    """
+    Test that service account policies are requested in batches of at most
+    20 and that failed sub-requests are left out so they are requested
+    individually
+    """
+    batches = []
+
+    class FakeBatch:
+        def __init__(self, callback):
+            self.callback = callback
+            self.requests = []
+            batches.append(self)
+
+        def add(self, request, request_id):
+            self.requests.append((request_id, request))
+
+        def execute(self):
+            for request_id, request in self.requests:
+                if request == "projects/test/serviceAccounts/sa-0@test":
+                    error = MagicMock()
+                    error.resp.status = 404
+                    self.callback(request_id, None, error)
+                else:
+                    self.callback(request_id, {"etag": request}, None)
+
+    cloud_manager.project_id = "test"
+    cloud_manager._iam_service.new_batch_http_request.side_effect = FakeBatch
+    (
+        cloud_manager._iam_service.projects.return_value.serviceAccounts.return_value.getIamPolicy.side_effect
+    ) = lambda resource: resource
+
+    service_accounts = ["sa-{}@test".format(i) for i in range(25)]
+    policies = get_service_account_policies(service_accounts, cloud_manager)
+
+    assert [len(batch.requests) for batch in batches] == [20, 5]
+    assert "sa-0@test" not in policies
+    assert policies["sa-24@test"].status_code == 200
+    assert policies["sa-24@test"].json() == {
+        "etag": "projects/test/serviceAccounts/sa-24@test"
+    }
+
+
+def test_all_users_have_access_to_project(db_session, test_project):
+    """
+    Test that access is only valid if every user has access to the project
+    """
+    user_a = User(username="user_a", email="user_a@example.com")
+    user_b = User(username="user_b", email="user_b@example.com")
+    db_session.add_all([user_a, user_b])
+    db_session.commit()
+    db_session.add(AccessPrivilege(user_id=user_a.id, project_id=test_project.id))
+    db_session.commit()
+
+    assert do_all_users_have_access_to_project([user_a], test_project.id)
+    assert not do_all_users_have_access_to_project([user_a, user_b], test_project.id)
+
+    db_session.add(AccessPrivilege(user_id=user_b.id, project_id=test_project.id))
+    db_session.commit()
+
+    assert do_all_users_have_access_to_project([user_a, user_b], test_project.id)
+
+
+def test_is_user_member_of_all_google_projects_one_project_fails(
+    cloud_manager, db_session
+):
+    """
+    Test that the user is not a member of all projects if the membership of
+    one of them can not be retrieved or does not include the user
+    """
+    google_project_ids = ["project-{}".format(i) for i in range(5)]
+
+    def _get_membership(google_cloud_manager, project_id=None):
+        if google_cloud_manager.project_id == "project-3":
+            raise GoogleAPIError("no access")
+        return [GooglePolicyMember("user", "user@gmail.com")]
+
+    def _manager(project_id):
+        google_cloud_manager = MagicMock()
+        google_cloud_manager.project_id = project_id
+        return google_cloud_manager
+
+    manager_mock = MagicMock(side_effect=_manager)
+    member_mock = MagicMock(return_value=True)
+    with patch(
+        "fence.resources.google.access_utils._project_membership", _get_membership
+    ), patch("fence.resources.google.access_utils._get_manager", manager_mock), patch(
+        "fence.resources.google.access_utils.is_user_member_of_google_project",
+        member_mock,
+    ):
+        assert not is_user_member_of_all_google_projects(1, google_project_ids)
+        manager_mock.reset_mock()
+        member_mock.reset_mock()
+        assert is_user_member_of_all_google_projects(1, google_project_ids[:3])
+
+    # each project's manager is looked up once and handed to the member check
+    assert manager_mock.call_count == 3
+    checked_project_ids = sorted(
+        call[0][1].project_id for call in member_mock.call_args_list
+    )
+    assert checked_project_ids == google_project_ids[:3]
+
+
+def test_is_user_member_of_google_project(cloud_manager, test_linked_user):
+    """
+    Test that a user is a member of the project if either their email or
+    their linked Google account email is a member
+    """
+    user_id = test_linked_user.user_id
+
+    assert is_user_member_of_google_project(
+        user_id,
+        cloud_manager,
+        membership=[
+            GooglePolicyMember("serviceAccount", "sa@gmail.com"),
+            GooglePolicyMember("user", "Google_Test_User@gmail.com"),
+        ],
+    )
+    assert is_user_member_of_google_project(
+        user_id,
+        cloud_manager,
+        membership=[GooglePolicyMember("user", "google_test_linked_user@gmail.com")],
+    )
+    assert not is_user_member_of_google_project(
+        user_id,
+        cloud_manager,
+        membership=[GooglePolicyMember("user", "someone_else@gmail.com")],
+    )
+
+
+def test_token_bucket_waits_once_burst_is_used():
+    """
+    Test that the Google API rate limiter allows a burst of `rate` calls and
+    then makes callers wait for a token
+    """
+    clock = MagicMock(return_value=100.0)
+    with patch("fence.resources.google.access_utils.time") as mock_time:
+        mock_time.monotonic = clock
+        bucket = _TokenBucket(4)
+
+        for _ in range(4):
+            bucket.acquire()
+        assert not mock_time.sleep.called
+
+        bucket.acquire()
+        mock_time.sleep.assert_called_once_with(0.25)
+
+        # a second later the bucket has refilled
+        mock_time.sleep.reset_mock()
+        clock.return_value = 101.25
+        bucket.acquire()
+        assert not mock_time.sleep.called
+
+
+def test_token_bucket_takes_one_token_per_batched_call():
+    """
+    Test that acquiring several tokens at once, as for a batch request,
+    uses up the burst and waits for the remainder
+    """
+    clock = MagicMock(return_value=100.0)
+    with patch("fence.resources.google.access_utils.time") as mock_time:
+        mock_time.monotonic = clock
+        bucket = _TokenBucket(4)
+
+        bucket.acquire(4)
+        assert not mock_time.sleep.called
+
+        bucket.acquire(2)
+        mock_time.sleep.assert_called_once_with(0.5)
@@ -60,17 +60,24 @@ from datetime import datetime
 from io import StringIO
 from urllib.parse import quote
 
+from cirrus.google_cloud.iam import GooglePolicyMember
+
 from fence.models import (
     Bucket,
     Project,
     ProjectToBucket,
     GoogleBucketAccessGroup,
+    User,
     UserServiceAccount,
     ServiceAccountAccessPrivilege,
     ServiceAccountToGoogleBucketAccessGroup,
 )
 
 from fence.config import config
+from fence.resources.google.access_utils import (
+    GOOGLE_CLOUD_MANAGER_CACHE_SIZE,
+    get_google_project_membership,
+)
 
 from unittest.mock import MagicMock, patch, mock_open
 
@@ -1298,5 +1305,89 @@ def _assert_expected_error_response_structure(response, project_access):
     _assert_expected_error_info_structure(response.json["errors"]["project_access"])
 
 
+def test_delete_service_account_checks_current_project_membership(
+    client,
+    app,
+    db_session,
+    cloud_manager,
+    encoded_jwt_service_accounts_access,
+    register_user_service_account,
+):
+    """
+    Test that deleting a service account is authorized against the user's
+    current Google project membership, not a cached one.
+    """
+    encoded_creds_jwt = encoded_jwt_service_accounts_access["jwt"]
+    user = (
+        db_session.query(User)
+        .filter_by(id=encoded_jwt_service_accounts_access["user_id"])
+        .first()
+    )
+    service_account = register_user_service_account["service_account"]
+    google_cloud_manager = cloud_manager.return_value.__enter__.return_value
+    google_cloud_manager.project_id = service_account.google_project_id
+
+    # membership cached while the user was still on the Google project
+    google_cloud_manager.get_project_membership.return_value = [
+        GooglePolicyMember("user", user.email)
+    ]
+    get_google_project_membership(
+        service_account.google_project_id, google_cloud_manager
+    )
+
+    # user has since been removed from the Google project
+    google_cloud_manager.get_project_membership.return_value = []
+
+    response = client.delete(
+        "/google/service_accounts/{}".format(quote(service_account.email)),
+        headers={"Authorization": "Bearer " + encoded_creds_jwt},
+    )
+
+    assert response.status_code == 403
+
+
 def _assert_expected_error_info_structure(data):
     assert EXPECTED_ERROR_RESPONSE_KEYS.issubset(list(data.keys()))
+
+
+def test_get_service_accounts_invalid_google_project_ids(
+    client, app, cloud_manager, encoded_jwt_service_accounts_access
+):
+    """
+    Test that listing service accounts rejects malformed Google project IDs
+    before setting up any cloud managers for them.
+    """
+    encoded_creds_jwt = encoded_jwt_service_accounts_access["jwt"]
+
+    response = client.get(
+        "/google/service_accounts?google_project_ids={}".format(
+            quote("valid-project-id,not_a_project!")
+        ),
+        headers={"Authorization": "Bearer " + encoded_creds_jwt},
+    )
+
+    assert response.status_code == 400
+    assert not cloud_manager.called
+
+
+def test_get_service_accounts_too_many_google_project_ids(
+    client, app, cloud_manager, encoded_jwt_service_accounts_access
+):
+    """
+    Test that listing service accounts rejects more Google project IDs than
+    the cloud manager cache can hold.
+    """
+    encoded_creds_jwt = encoded_jwt_service_accounts_access["jwt"]
+    google_project_ids = [
+        "project-{}".format(i) for i in range(GOOGLE_CLOUD_MANAGER_CACHE_SIZE + 1)
+    ]
+
+    response = client.get(
+        "/google/service_accounts?google_project_ids={}".format(
+            quote(",".join(google_project_ids))
+        ),
+        headers={"Authorization": "Bearer " + encoded_creds_jwt},
+    )
+
+    assert response.status_code == 400
+    assert not cloud_manager.called
@@ -1,3 +1,4 @@
+import functools
 import os
 import time
 import urllib.parse
@@ -25,8 +26,9 @@ import tests
 import tests.utils.oauth2
 
 
+@functools.lru_cache(maxsize=None)
 def read_file(filename):
-    """Read the contents of a file in the tests directory."""
+    """Read the contents of a file in the tests directory (cached)."""
     root_dir = os.path.dirname(os.path.realpath(tests.__file__))
     with open(os.path.join(root_dir, filename), "r") as f:
         return f.read()